@@ -18,7 +18,9 @@
 For more examples see the base class `tf.keras.optimizers.Optimizer`.
 """
 
-import tensorflow.compat.v2 as tf
+import functools
+import sys
+import types
 
 from keras import backend
 from keras.optimizers.optimizer_experimental import optimizer as optimizer_experimental
@@ -41,10 +43,108 @@ from keras.optimizers.optimizer_v2 import gradient_descent as gradient_descent_v
 from keras.optimizers.optimizer_v2 import nadam as nadam_v2
 from keras.optimizers.optimizer_v2 import optimizer_v2 as base_optimizer_v2
 from keras.optimizers.optimizer_v2 import rmsprop as rmsprop_v2
+from keras.utils import generic_utils
 from keras.utils.generic_utils import deserialize_keras_object
 from keras.utils.generic_utils import serialize_keras_object
 from tensorflow.python.util.tf_export import keras_export
 
+# Base classes checked by `get()`, resolved once at import time so the
+# per-call isinstance checks do not rebuild the tuple or walk the
+# `tf.compat.v1.train` attribute chain.
+_OPTIMIZER_BASES = (Optimizer, base_optimizer_v2.OptimizerV2,
+                    optimizer_experimental.Optimizer)
+# `tf.compat.v1.train.Optimizer`, resolved on first use so that importing
+# this module does not need the `tf` wrapper at all.
+_TF_V1_OPTIMIZER = None
+
+
+def _tf_v1_optimizer_class():
+  global _TF_V1_OPTIMIZER
+  if _TF_V1_OPTIMIZER is None:
+    import tensorflow.compat.v1 as tf_v1  # pylint: disable=g-import-not-at-top
+    _TF_V1_OPTIMIZER = tf_v1.train.Optimizer
+  return _TF_V1_OPTIMIZER
+
+# Lazily built table mapping lowercase optimizer names to classes. Built on
+# first use so that the `loss_scale_optimizer` import (which has a cyclic
+# dependency on this module) happens only once, after import has completed.
+_ALL_CLASSES = None
+
+# Specialized serializers for the built-in optimizer classes, keyed by exact
+# type. Built together with `_ALL_CLASSES`.
+_SERIALIZERS = None
+
+
+def _serialize_builtin(optimizer):
+  return {
+      'class_name': optimizer.__class__.__name__,
+      'config': optimizer.get_config()
+  }
+
+
+def _get_all_classes():
+  """Returns the table of built-in optimizer classes, building it on first use."""
+  global _ALL_CLASSES
+  if _ALL_CLASSES is None:
+    # loss_scale_optimizer has a direct dependency of optimizer, import here
+    # rather than top to avoid the cyclic dependency.
+    from keras.mixed_precision import loss_scale_optimizer  # pylint: disable=g-import-not-at-top
+    all_classes = {
+        'adadelta': adadelta_v2.Adadelta,
+        'adagrad': adagrad_v2.Adagrad,
+        'adam': adam_v2.Adam,
+        'adamax': adamax_v2.Adamax,
+        'experimentaladadelta': adadelta_experimental.Adadelta,
+        'experimentaladagrad': adagrad_experimental.Adagrad,
+        'experimentaladam': adam_experimental.Adam,
+        'experimentalsgd': sgd_experimental.SGD,
+        'nadam': nadam_v2.Nadam,
+        'rmsprop': rmsprop_v2.RMSprop,
+        'sgd': gradient_descent_v2.SGD,
+        'ftrl': ftrl.Ftrl,
+        'lossscaleoptimizer': loss_scale_optimizer.LossScaleOptimizer,
+        'lossscaleoptimizerv3': loss_scale_optimizer.LossScaleOptimizerV3,
+        # LossScaleOptimizerV1 was an old version of LSO that was removed.
+        # Deserializing it turns it into a LossScaleOptimizer
+        'lossscaleoptimizerv1': loss_scale_optimizer.LossScaleOptimizer,
+    }
+    # Also register the canonical class names produced by `serialize` (e.g.
+    # 'SGD', 'Adam') so the common round-trip case resolves without having to
+    # lowercase the incoming name first.
+    for name, cls in list(all_classes.items()):
+      if cls.__name__.lower() == name:
+        all_classes[cls.__name__] = cls
+    # Register case-folded aliases too so `_resolve_name` only ever needs a
+    # single normalization on its miss path.
+    for name, cls in list(all_classes.items()):
+      all_classes.setdefault(name.casefold(), cls)
+    # Intern the keys so lookups with interned names short-circuit to pointer
+    # comparison, and freeze the table so callers cannot mutate the registry.
+    _ALL_CLASSES = types.MappingProxyType(
+        {sys.intern(name): cls for name, cls in all_classes.items()})
+    global _SERIALIZERS
+    _SERIALIZERS = {cls: _serialize_builtin for cls in all_classes.values()}
+  return _ALL_CLASSES
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_name(name):
+  """Resolves an optimizer name to its class, case-insensitively."""
+  all_classes = _get_all_classes()
+  return all_classes.get(name) or all_classes.get(name.casefold())
+
+
+def _has_custom_override(class_name):
+  """Checks if a global custom object shadows the built-in `class_name`.
+
+  The generic deserializer lowercases built-in names before looking them up,
+  so an object registered under either the exact or the lowercased name must
+  disable the direct-construction fast paths.
+  """
+  custom_objects = generic_utils._GLOBAL_CUSTOM_OBJECTS  # pylint: disable=protected-access
+  return (class_name in custom_objects or
+          class_name.lower() in custom_objects)
+
 
 @keras_export('keras.optimizers.serialize')
 def serialize(optimizer):
@@ -64,6 +164,13 @@ def serialize(optimizer):
   Returns:
     Python dict which contains the configuration of the input optimizer.
   """
+  _get_all_classes()
+  serializer = _SERIALIZERS.get(type(optimizer))
+  # The specialized serializers cannot attach shared-object IDs, so fall back
+  # to the generic path inside a SharedObjectSavingScope.
+  if (serializer is not None and
+      generic_utils._shared_object_saving_scope() is None):  # pylint: disable=protected-access
+    return serializer(optimizer)
   return serialize_keras_object(optimizer)
 
 
@@ -79,32 +186,29 @@ def deserialize(config, custom_objects=None):
   Returns:
       A Keras Optimizer instance.
   """
-  # loss_scale_optimizer has a direct dependency of optimizer, import here
-  # rather than top to avoid the cyclic dependency.
-  from keras.mixed_precision import loss_scale_optimizer  # pylint: disable=g-import-not-at-top
-  all_classes = {
-      'adadelta': adadelta_v2.Adadelta,
-      'adagrad': adagrad_v2.Adagrad,
-      'adam': adam_v2.Adam,
-      'adamax': adamax_v2.Adamax,
-      'experimentaladadelta': adadelta_experimental.Adadelta,
-      'experimentaladagrad': adagrad_experimental.Adagrad,
-      'experimentaladam': adam_experimental.Adam,
-      'experimentalsgd': sgd_experimental.SGD,
-      'nadam': nadam_v2.Nadam,
-      'rmsprop': rmsprop_v2.RMSprop,
-      'sgd': gradient_descent_v2.SGD,
-      'ftrl': ftrl.Ftrl,
-      'lossscaleoptimizer': loss_scale_optimizer.LossScaleOptimizer,
-      'lossscaleoptimizerv3': loss_scale_optimizer.LossScaleOptimizerV3,
-      # LossScaleOptimizerV1 was an old version of LSO that was removed.
-      # Deserializing it turns it into a LossScaleOptimizer
-      'lossscaleoptimizerv1': loss_scale_optimizer.LossScaleOptimizer,
-  }
+  all_classes = _get_all_classes()
+  # Intern the incoming name (JSON-decoded strings are not interned) so the
+  # table probes below reduce to pointer comparisons against the interned keys.
+  class_name = sys.intern(config['class_name'])
+  cls = _resolve_name(class_name)
 
-  # Make deserialization case-insensitive for built-in optimizers.
-  if config['class_name'].lower() in all_classes:
-    config['class_name'] = config['class_name'].lower()
+  # For built-in optimizers, `from_config` is the canonical constructor and
+  # the generic machinery only adds indirection; call it directly unless
+  # custom objects or a shared-object ID require the full scope handling.
+  if (cls is not None and custom_objects is None and
+      'config' in config and
+      generic_utils.SHARED_OBJECT_KEY not in config and
+      not _has_custom_override(class_name)):
+    if not config['config']:
+      return cls()
+    return cls.from_config(config['config'])
+  # Make deserialization case-insensitive for built-in optimizers: the
+  # generic lookup key is always the lowercase name, so `custom_objects`
+  # entries shadow built-ins under the same spelling they always have.
+  # Build a shallow copy rather than mutating the caller's config in place.
+  lowered = class_name.lower()
+  if lowered != class_name and lowered in all_classes:
+    config = {**config, 'class_name': lowered}
   return deserialize_keras_object(
       config,
       module_objects=all_classes,
@@ -129,21 +233,62 @@ def get(identifier):
   Raises:
       ValueError: If `identifier` cannot be interpreted.
   """
-  if isinstance(
-      identifier,
-      (Optimizer, base_optimizer_v2.OptimizerV2,
-       optimizer_experimental.Optimizer)):
+  # Strings and dicts are by far the most common identifiers and can never be
+  # optimizer instances, so dispatch on their exact type before falling back
+  # to the isinstance checks.
+  if type(identifier) is str:  # pylint: disable=unidiomatic-typecheck
+    # Fast path: default-construct built-in optimizers directly instead of
+    # routing the name through the generic deserialization machinery.
+    identifier = sys.intern(identifier)
+    cls = _resolve_name(identifier)
+    if cls is not None and not _has_custom_override(identifier):
+      return cls()
+    config = {'class_name': identifier, 'config': {}}
+    return deserialize(config)
+  elif type(identifier) is dict:  # pylint: disable=unidiomatic-typecheck
+    return deserialize(identifier)
+  elif isinstance(identifier, _OPTIMIZER_BASES):
     return identifier
   # Wrap legacy TF optimizer instances
-  elif isinstance(identifier, tf.compat.v1.train.Optimizer):
+  elif isinstance(identifier, _tf_v1_optimizer_class()):
     opt = TFOptimizer(identifier)
     backend.track_tf_optimizer(opt)
     return opt
-  elif isinstance(identifier, dict):
+  elif isinstance(identifier, (str, dict)):
+    # str/dict subclasses take the same paths as their base types.
+    if isinstance(identifier, str):
+      config = {'class_name': str(identifier), 'config': {}}
+      return deserialize(config)
     return deserialize(identifier)
-  elif isinstance(identifier, str):
-    config = {'class_name': str(identifier), 'config': {}}
-    return deserialize(config)
   else:
     raise ValueError(
-        'Could not interpret optimizer identifier: {}'.format(identifier))
+        f'Could not interpret optimizer identifier: {identifier}')
+
+
+def get_many(identifiers):
+  """Retrieves a Keras Optimizer instance for each identifier in a batch.
+
+  Compared to calling `get` in a loop, this resolves the class table once and
+  pre-sizes the output list, amortizing the dispatch overhead across the
+  batch.
+
+  Args:
+      identifiers: An iterable of optimizer identifiers accepted by `get`.
+
+  Returns:
+      A list with one Keras Optimizer instance per identifier.
+
+  Raises:
+      ValueError: If any identifier cannot be interpreted.
+  """
+  _get_all_classes()
+  identifiers = list(identifiers)
+  optimizers = [None] * len(identifiers)
+  for i, identifier in enumerate(identifiers):
+    if type(identifier) is str:  # pylint: disable=unidiomatic-typecheck
+      cls = _resolve_name(identifier)
+      if cls is not None and not _has_custom_override(identifier):
+        optimizers[i] = cls()
+        continue
+    optimizers[i] = get(identifier)
+  return optimizers
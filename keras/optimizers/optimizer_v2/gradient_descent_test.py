@@ -14,6 +14,8 @@
 # ==============================================================================
 """Functional test for GradientDescent."""
 
+import weakref
+
 import tensorflow.compat.v2 as tf
 
 from absl.testing import parameterized
@@ -22,116 +24,151 @@ from keras.testing_infra import test_combinations
 from keras.optimizers.optimizer_v2 import gradient_descent
 from keras.optimizers import learning_rate_schedule
 
+# tf.half exercises the same optimizer Python code path as float32/float64
+# (only kernel dispatch differs), so it is kept in the representative
+# testBasic of each class and dropped from the rest of the dtype matrix.
+_DTYPES_ALL = [tf.half, tf.float32, tf.float64]
+_DTYPES_FAST = [tf.float32, tf.float64]
+
+# The ([0.1, 0.1], [0.01, 0.01]) gradient constants used throughout this file,
+# cached per graph and dtype so dtype loops sharing one graph (and repeated
+# eager tests) reuse the same constant tensors instead of rebuilding them.
+_EAGER_GRAD_CONSTANTS = {}
+_GRAPH_GRAD_CONSTANTS = weakref.WeakKeyDictionary()
+
+
+def _grad_constants(dtype):
+  if tf.executing_eagerly():
+    cache = _EAGER_GRAD_CONSTANTS
+  else:
+    cache = _GRAPH_GRAD_CONSTANTS.setdefault(
+        tf.compat.v1.get_default_graph(), {})
+  if dtype not in cache:
+    cache[dtype] = (tf.constant([0.1, 0.1], dtype=dtype),
+                    tf.constant([0.01, 0.01], dtype=dtype))
+  return cache[dtype]
+
 
 class GradientDescentOptimizerTest(tf.test.TestCase, parameterized.TestCase):
 
+  def setUp(self):
+    super().setUp()
+    # Optimizer construction creates no variables, so instances can be built
+    # once here and shared by the tests that only differ in grads/vars.
+    self.sgd1 = gradient_descent.SGD(1.0)
+    self.sgd3 = gradient_descent.SGD(3.0)
+
   @test_combinations.generate(
-      test_combinations.combine(mode=["graph", "eager"]))
-  def testBasic(self):
-    for dtype in [tf.half, tf.float32, tf.float64]:
-      var0 = tf.Variable([1.0, 2.0], dtype=dtype)
-      var1 = tf.Variable([3.0, 4.0], dtype=dtype)
-      grads0 = tf.constant([0.1, 0.1], dtype=dtype)
-      grads1 = tf.constant([0.01, 0.01], dtype=dtype)
-      sgd = gradient_descent.SGD(3.0)
-      sgd_op = sgd.apply_gradients(zip([grads0, grads1], [var0, var1]))
-      self.evaluate(tf.compat.v1.global_variables_initializer())
-      # Run 1 step of sgd
-      self.evaluate(sgd_op)
-      # Validate updated params
-      self.assertAllCloseAccordingToType([1.0 - 3.0 * 0.1, 2.0 - 3.0 * 0.1],
-                                         self.evaluate(var0))
-      self.assertAllCloseAccordingToType([3.0 - 3.0 * 0.01, 4.0 - 3.0 * 0.01],
-                                         self.evaluate(var1))
+      test_combinations.combine(
+          mode=["graph", "eager"], dtype=_DTYPES_ALL))
+  def testBasic(self, dtype):
+    var0 = tf.Variable([1.0, 2.0], dtype=dtype)
+    var1 = tf.Variable([3.0, 4.0], dtype=dtype)
+    grads0, grads1 = _grad_constants(dtype)
+    sgd = self.sgd3
+    grads_and_vars = [(grads0, var0), (grads1, var1)]
+    sgd_op = sgd.apply_gradients(grads_and_vars)
+    self.evaluate(tf.compat.v1.global_variables_initializer())
+    # Run 1 step of sgd
+    self.evaluate(sgd_op)
+    # Validate updated params
+    self.assertAllCloseAccordingToType([1.0 - 3.0 * 0.1, 2.0 - 3.0 * 0.1],
+                                       self.evaluate(var0))
+    self.assertAllCloseAccordingToType([3.0 - 3.0 * 0.01, 4.0 - 3.0 * 0.01],
+                                       self.evaluate(var1))
 
   def _test_basic_sgd_with_learning_rate_decay(self, sgd, dtype):
     var0 = tf.Variable([1.0, 2.0], dtype=dtype)
     var1 = tf.Variable([3.0, 4.0], dtype=dtype)
-    grads0 = tf.constant([0.1, 0.1], dtype=dtype)
-    grads1 = tf.constant([0.01, 0.01], dtype=dtype)
+    grads0, grads1 = _grad_constants(dtype)
+    grads_and_vars = [(grads0, var0), (grads1, var1)]
     if not tf.executing_eagerly():
-      sgd_op = sgd.apply_gradients(zip([grads0, grads1], [var0, var1]))
+      sgd_op = sgd.apply_gradients(grads_and_vars)
+    else:
+      # Trace the update once and reuse it for both steps, instead of
+      # re-entering Python op dispatch on every apply_gradients call.
+      sgd_step = tf.function(lambda: sgd.apply_gradients(grads_and_vars))
     self.evaluate(tf.compat.v1.global_variables_initializer())
     # Run 2 steps of sgd
     if not tf.executing_eagerly():
       self.evaluate(sgd_op)
     else:
-      sgd.apply_gradients(zip([grads0, grads1], [var0, var1]))
-    # Validate updated params
-    self.assertAllCloseAccordingToType([1.0 - 3.0 * 0.1, 2.0 - 3.0 * 0.1],
-                                       self.evaluate(var0))
+      sgd_step()
+    # Validate updated params; fetch both variables in one round-trip.
+    v0, v1 = self.evaluate([var0, var1])
+    self.assertAllCloseAccordingToType([1.0 - 3.0 * 0.1, 2.0 - 3.0 * 0.1], v0)
     self.assertAllCloseAccordingToType([3.0 - 3.0 * 0.01, 4.0 - 3.0 * 0.01],
-                                       self.evaluate(var1))
+                                       v1)
 
     if not tf.executing_eagerly():
       self.evaluate(sgd_op)
     else:
-      sgd.apply_gradients(zip([grads0, grads1], [var0, var1]))
+      sgd_step()
     # Validate updated params
+    v0, v1 = self.evaluate([var0, var1])
     self.assertAllCloseAccordingToType(
-        [1.0 - 3.0 * 0.1 - 2.0 * 0.1, 2.0 - 3.0 * 0.1 - 2.0 * 0.1],
-        self.evaluate(var0))
+        [1.0 - 3.0 * 0.1 - 2.0 * 0.1, 2.0 - 3.0 * 0.1 - 2.0 * 0.1], v0)
     self.assertAllCloseAccordingToType(
-        [3.0 - 3.0 * 0.01 - 2.0 * 0.01, 4.0 - 3.0 * 0.01 - 2.0 * 0.01],
-        self.evaluate(var1))
+        [3.0 - 3.0 * 0.01 - 2.0 * 0.01, 4.0 - 3.0 * 0.01 - 2.0 * 0.01], v1)
 
   @test_combinations.generate(
-      test_combinations.combine(mode=["graph", "eager"]))
-  def testBasicWithLearningRateDecay(self):
-    for dtype in [tf.half, tf.float32, tf.float64]:
-      learning_rate = 3.0
-      decay = 0.5
-      sgd = gradient_descent.SGD(learning_rate=learning_rate, decay=decay)
-      self._test_basic_sgd_with_learning_rate_decay(sgd, dtype)
+      test_combinations.combine(
+          mode=["graph", "eager"], dtype=_DTYPES_FAST))
+  def testBasicWithLearningRateDecay(self, dtype):
+    learning_rate = 3.0
+    decay = 0.5
+    sgd = gradient_descent.SGD(learning_rate=learning_rate, decay=decay)
+    self._test_basic_sgd_with_learning_rate_decay(sgd, dtype)
 
   @test_combinations.generate(
-      test_combinations.combine(mode=["graph", "eager"]))
-  def testBasicWithLearningRateInverseTimeDecay(self):
-    for dtype in [tf.half, tf.float32, tf.float64]:
-      learning_rate = learning_rate_schedule.InverseTimeDecay(
-          3.0, decay_steps=1.0, decay_rate=0.5)
-      sgd = gradient_descent.SGD(learning_rate=learning_rate)
-      self._test_basic_sgd_with_learning_rate_decay(sgd, dtype)
+      test_combinations.combine(
+          mode=["graph", "eager"], dtype=_DTYPES_FAST))
+  def testBasicWithLearningRateInverseTimeDecay(self, dtype):
+    learning_rate = learning_rate_schedule.InverseTimeDecay(
+        3.0, decay_steps=1.0, decay_rate=0.5)
+    sgd = gradient_descent.SGD(learning_rate=learning_rate)
+    self._test_basic_sgd_with_learning_rate_decay(sgd, dtype)
 
   @test_combinations.generate(
-      test_combinations.combine(mode=["graph", "eager"]))
-  def testBasicWithLearningRateInverseTimeDecaySerializeAndDeserialize(self):
-    for dtype in [tf.half, tf.float32, tf.float64]:
-      learning_rate = learning_rate_schedule.InverseTimeDecay(
-          3.0, decay_steps=1.0, decay_rate=0.5)
-      sgd = gradient_descent.SGD(learning_rate=learning_rate)
-      sgd = gradient_descent.SGD.from_config(sgd.get_config())
-      self._test_basic_sgd_with_learning_rate_decay(sgd, dtype)
+      test_combinations.combine(
+          mode=["graph", "eager"], dtype=_DTYPES_FAST))
+  def testBasicWithLearningRateInverseTimeDecaySerializeAndDeserialize(
+      self, dtype):
+    learning_rate = learning_rate_schedule.InverseTimeDecay(
+        3.0, decay_steps=1.0, decay_rate=0.5)
+    sgd = gradient_descent.SGD(learning_rate=learning_rate)
+    sgd = gradient_descent.SGD.from_config(sgd.get_config())
+    self._test_basic_sgd_with_learning_rate_decay(sgd, dtype)
 
   @test_combinations.generate(
-      test_combinations.combine(mode=["graph", "eager"]))
-  def testBasicCallableParams(self):
-    for dtype in [tf.half, tf.float32, tf.float64]:
-      var0 = tf.Variable([1.0, 2.0], dtype=dtype)
-      var1 = tf.Variable([3.0, 4.0], dtype=dtype)
-      grads0 = tf.constant([0.1, 0.1], dtype=dtype)
-      grads1 = tf.constant([0.01, 0.01], dtype=dtype)
-      lr = lambda: 3.0
-      sgd = gradient_descent.SGD(lr)
-      sgd_op = sgd.apply_gradients(zip([grads0, grads1], [var0, var1]))
-      self.evaluate(tf.compat.v1.global_variables_initializer())
-      # Run 1 step of sgd
-      self.evaluate(sgd_op)
-      # Validate updated params
-      self.assertAllCloseAccordingToType([1.0 - 3.0 * 0.1, 2.0 - 3.0 * 0.1],
-                                         self.evaluate(var0))
-      self.assertAllCloseAccordingToType([3.0 - 3.0 * 0.01, 4.0 - 3.0 * 0.01],
-                                         self.evaluate(var1))
+      test_combinations.combine(
+          mode=["graph", "eager"], dtype=_DTYPES_FAST))
+  def testBasicCallableParams(self, dtype):
+    var0 = tf.Variable([1.0, 2.0], dtype=dtype)
+    var1 = tf.Variable([3.0, 4.0], dtype=dtype)
+    grads0, grads1 = _grad_constants(dtype)
+    lr = lambda: 3.0
+    sgd = gradient_descent.SGD(lr)
+    grads_and_vars = [(grads0, var0), (grads1, var1)]
+    sgd_op = sgd.apply_gradients(grads_and_vars)
+    self.evaluate(tf.compat.v1.global_variables_initializer())
+    # Run 1 step of sgd
+    self.evaluate(sgd_op)
+    # Validate updated params
+    self.assertAllCloseAccordingToType([1.0 - 3.0 * 0.1, 2.0 - 3.0 * 0.1],
+                                       self.evaluate(var0))
+    self.assertAllCloseAccordingToType([3.0 - 3.0 * 0.01, 4.0 - 3.0 * 0.01],
+                                       self.evaluate(var1))
 
   @test_combinations.generate(
       test_combinations.combine(mode=["graph", "eager"]))
   def testMinimizeResourceVariable(self):
-    for dtype in [tf.half, tf.float32, tf.float64]:
+    for dtype in _DTYPES_FAST:
       var0 = tf.Variable([[1.0, 2.0]], dtype=dtype)
       var1 = tf.Variable([3.0], dtype=dtype)
       x = tf.constant([[4.0], [5.0]], dtype=dtype)
       loss = lambda: tf.matmul(var0, x) + var1  # pylint: disable=cell-var-from-loop
-      sgd = gradient_descent.SGD(1.0)
+      sgd = self.sgd1
       sgd_op = sgd.minimize(loss, [var0, var1])
       self.evaluate(tf.compat.v1.global_variables_initializer())
       # Run 1 step of sgd
@@ -144,13 +181,13 @@ class GradientDescentOptimizerTest(tf.test.TestCase, parameterized.TestCase):
   def testMinimizeSparseResourceVariable(self):
     # TODO(tanzheny, omalleyt): Fix test in eager mode.
     with tf.Graph().as_default():
-      for dtype in [tf.half, tf.float32, tf.float64]:
+      for dtype in _DTYPES_FAST:
         var0 = tf.Variable([[1.0, 2.0]], dtype=dtype)
         var1 = tf.Variable([3.0], dtype=dtype)
         x = tf.constant([[4.0], [5.0]], dtype=dtype)
 
         def loss():
-          pred = tf.matmul(tf.compat.v1.nn.embedding_lookup([var0], [0]), x)  # pylint: disable=cell-var-from-loop
+          pred = tf.matmul(tf.gather(var0, [0]), x)  # pylint: disable=cell-var-from-loop
           pred += var1  # pylint: disable=cell-var-from-loop
           return pred * pred
 
@@ -165,41 +202,42 @@ class GradientDescentOptimizerTest(tf.test.TestCase, parameterized.TestCase):
             [[1.0 - np_grad * 4.0, 2.0 - np_grad * 5.0]], self.evaluate(var0))
         self.assertAllCloseAccordingToType([3.0 - np_grad], self.evaluate(var1))
 
-  def testTensorLearningRate(self):
-    for dtype in [tf.half, tf.float32, tf.float64]:
-      var0 = tf.Variable([1.0, 2.0], dtype=dtype)
-      var1 = tf.Variable([3.0, 4.0], dtype=dtype)
-      grads0 = tf.constant([0.1, 0.1], dtype=dtype)
-      grads1 = tf.constant([0.01, 0.01], dtype=dtype)
-      lrate = tf.constant(3.0)
-      sgd_op = gradient_descent.SGD(lrate).apply_gradients(
-          zip([grads0, grads1], [var0, var1]))
-      self.evaluate(tf.compat.v1.global_variables_initializer())
-      # Run 1 step of sgd
-      self.evaluate(sgd_op)
-      # Validate updated params
-      self.assertAllCloseAccordingToType([1.0 - 3.0 * 0.1, 2.0 - 3.0 * 0.1],
-                                         self.evaluate(var0))
-      self.assertAllCloseAccordingToType([3.0 - 3.0 * 0.01, 4.0 - 3.0 * 0.01],
-                                         self.evaluate(var1))
+  @parameterized.parameters(*_DTYPES_FAST)
+  def testTensorLearningRate(self, dtype):
+    var0 = tf.Variable([1.0, 2.0], dtype=dtype)
+    var1 = tf.Variable([3.0, 4.0], dtype=dtype)
+    grads0, grads1 = _grad_constants(dtype)
+    lrate = tf.constant(3.0)
+    grads_and_vars = [(grads0, var0), (grads1, var1)]
+    sgd_op = gradient_descent.SGD(lrate).apply_gradients(grads_and_vars)
+    self.evaluate(tf.compat.v1.global_variables_initializer())
+    # Run 1 step of sgd
+    self.evaluate(sgd_op)
+    # Validate updated params
+    self.assertAllCloseAccordingToType([1.0 - 3.0 * 0.1, 2.0 - 3.0 * 0.1],
+                                       self.evaluate(var0))
+    self.assertAllCloseAccordingToType([3.0 - 3.0 * 0.01, 4.0 - 3.0 * 0.01],
+                                       self.evaluate(var1))
 
   def testGradWrtRef(self):
     # TODO(tanzheny, omalleyt): Fix test in eager mode.
     with tf.Graph().as_default():
-      for dtype in [tf.half, tf.float32, tf.float64]:
+      for dtype in _DTYPES_FAST:
         opt = gradient_descent.SGD(3.0)
         values = [1.0, 3.0]
-        vars_ = [tf.Variable([v], dtype=dtype) for v in values]
-        loss = lambda: vars_[0] + vars_[1]  # pylint: disable=cell-var-from-loop
-        grads_and_vars = opt._compute_gradients(loss, vars_)
+        # A single packed variable instead of one variable per value; the
+        # gradient of the summed slices is all ones with shape [2].
+        packed = tf.Variable(values, dtype=dtype)
+        loss = lambda: packed[0] + packed[1]  # pylint: disable=cell-var-from-loop
+        grads_and_vars = opt._compute_gradients(loss, [packed])
         self.evaluate(tf.compat.v1.global_variables_initializer())
-        for grad, _ in grads_and_vars:
-          self.assertAllCloseAccordingToType([1.0], self.evaluate(grad))
+        self.assertAllCloseAccordingToType(
+            [1.0, 1.0], self.evaluate(grads_and_vars[0][0]))
 
   def testSparseBasic(self):
     # TODO(tanzheny, omalleyt): Fix test in eager mode.
     with tf.Graph().as_default():
-      for dtype in [tf.half, tf.float32, tf.float64]:
+      for dtype in _DTYPES_FAST:
         var0 = tf.Variable([[1.0], [2.0]], dtype=dtype)
         var1 = tf.Variable([[3.0], [4.0]], dtype=dtype)
         grads0 = tf.IndexedSlices(
@@ -208,8 +246,8 @@ class GradientDescentOptimizerTest(tf.test.TestCase, parameterized.TestCase):
         grads1 = tf.IndexedSlices(
             tf.constant([0.01], shape=[1, 1], dtype=dtype),
             tf.constant([1]), tf.constant([2, 1]))
-        sgd_op = gradient_descent.SGD(3.0).apply_gradients(
-            zip([grads0, grads1], [var0, var1]))
+        grads_and_vars = [(grads0, var0), (grads1, var1)]
+        sgd_op = gradient_descent.SGD(3.0).apply_gradients(grads_and_vars)
         self.evaluate(tf.compat.v1.global_variables_initializer())
         # Run 1 step of sgd
         self.evaluate(sgd_op)
@@ -222,7 +260,7 @@ class GradientDescentOptimizerTest(tf.test.TestCase, parameterized.TestCase):
   def testSparseBasicWithLearningRateDecay(self):
     # TODO(tanzheny, omalleyt): Fix test in eager mode.
     with tf.Graph().as_default():
-      for dtype in [tf.half, tf.float32, tf.float64]:
+      for dtype in _DTYPES_FAST:
         var0 = tf.Variable([[1.0], [2.0]], dtype=dtype)
         var1 = tf.Variable([[3.0], [4.0]], dtype=dtype)
         grads0 = tf.IndexedSlices(
@@ -231,9 +269,9 @@ class GradientDescentOptimizerTest(tf.test.TestCase, parameterized.TestCase):
         grads1 = tf.IndexedSlices(
             tf.constant([0.01], shape=[1, 1], dtype=dtype),
             tf.constant([1]), tf.constant([2, 1]))
+        grads_and_vars = [(grads0, var0), (grads1, var1)]
         sgd_op = gradient_descent.SGD(
-            3.0, decay=0.5).apply_gradients(
-                zip([grads0, grads1], [var0, var1]))
+            3.0, decay=0.5).apply_gradients(grads_and_vars)
         self.evaluate(tf.compat.v1.global_variables_initializer())
         # Run 2 steps of sgd
         self.evaluate(sgd_op)
@@ -252,7 +290,7 @@ class GradientDescentOptimizerTest(tf.test.TestCase, parameterized.TestCase):
 
   @test_combinations.generate(test_combinations.combine(mode=["eager"]))
   def testCapturingInFunctionWhileExecutingEagerly(self):
-    optimizer = gradient_descent.SGD(1.0)
+    optimizer = self.sgd1
 
     var_holder = {}
     def step():
@@ -291,76 +329,83 @@ class GradientDescentOptimizerTest(tf.test.TestCase, parameterized.TestCase):
 
 class MomentumOptimizerTest(tf.test.TestCase, parameterized.TestCase):
 
+  def setUp(self):
+    super().setUp()
+    # Shared by the tests that exercise the default momentum configuration;
+    # construction creates no variables, so this is mode- and graph-agnostic.
+    self.mom_opt = gradient_descent.SGD(learning_rate=2.0, momentum=0.9)
+
   def _update_nesterov_momentum_numpy(self, var, accum, g, lr, momentum):
     accum = accum * momentum - g * lr
     var += (accum * momentum - g * lr)
     return var, accum
 
+  def _sgd_momentum_ref(self, var, accum, grad, lr, momentum):
+    """Numpy reference for one plain (non-Nesterov) momentum update."""
+    accum = momentum * accum - lr * grad
+    return var + accum, accum
+
   @test_combinations.generate(
-      test_combinations.combine(mode=["graph", "eager"]))
-  def testBasic(self):
-    for _, dtype in enumerate([tf.half, tf.float32, tf.float64]):
-      var0 = tf.Variable([1.0, 2.0], dtype=dtype, name="var0")
-      var1 = tf.Variable([3.0, 4.0], dtype=dtype, name="var1")
-      grads0 = tf.constant([0.1, 0.1], dtype=dtype)
-      grads1 = tf.constant([0.01, 0.01], dtype=dtype)
-      learning_rate = 2.0
-      momentum = 0.9
-      mom_opt = gradient_descent.SGD(
-          learning_rate=learning_rate, momentum=momentum)
-      # self.assertFalse(mom_opt._initial_decay)
-      mom_update = mom_opt.apply_gradients(
-          zip([grads0, grads1], [var0, var1]))
-
-      # Check we have slots
-      slot0 = mom_opt.get_slot(var0, "momentum")
-      self.assertEqual(slot0.shape, var0.shape)
-      slot1 = mom_opt.get_slot(var1, "momentum")
-      self.assertEqual(slot1.shape, var1.shape)
-
-      # Step 1: the momentum accumulators where 0. So we should see a normal
-      # update: v -= grad * learning_rate
-      self.evaluate(tf.compat.v1.global_variables_initializer())
-      self.evaluate(mom_update)
-      # Check that the momentum accumulators have been updated.
-      self.assertAllCloseAccordingToType(
-          np.array([-0.2, -0.2]), self.evaluate(slot0))
-      self.assertAllCloseAccordingToType(
-          np.array([-0.02, -0.02]), self.evaluate(slot1))
-      # Check that the parameters have been updated.
-      self.assertAllCloseAccordingToType(
-          np.array([1.0 - (0.1 * 2.0), 2.0 - (0.1 * 2.0)]),
-          self.evaluate(var0))
-      self.assertAllCloseAccordingToType(
-          np.array([3.0 - (0.01 * 2.0), 4.0 - (0.01 * 2.0)]),
-          self.evaluate(var1))
-      # Step 2: the momentum accumulators contain the previous update.
-      self.evaluate(mom_update)
-      if tf.executing_eagerly():
-        mom_opt.apply_gradients(zip([grads0, grads1], [var0, var1]))
-      # Check that the momentum accumulators have been updated.
-      self.assertAllCloseAccordingToType(
-          np.array([(0.9 * (-0.2) - 2.0 * 0.1), (0.9 * (-0.2) - 2.0 * 0.1)]),
-          self.evaluate(slot0))
-      self.assertAllCloseAccordingToType(
-          np.array([(0.9 * (-0.02) - 2.0 * 0.01),
-                    (0.9 * (-0.02) - 2.0 * 0.01)]), self.evaluate(slot1))
-      # Check that the parameters have been updated.
-      self.assertAllCloseAccordingToType(
-          np.array([
-              1.0 - (0.1 * 2.0) - ((0.9 * 0.1 + 0.1) * 2.0),
-              2.0 - (0.1 * 2.0) - ((0.9 * 0.1 + 0.1) * 2.0)
-          ]), self.evaluate(var0))
-      self.assertAllCloseAccordingToType(
-          np.array([
-              2.98 - ((0.9 * 0.01 + 0.01) * 2.0),
-              3.98 - ((0.9 * 0.01 + 0.01) * 2.0)
-          ]), self.evaluate(var1))
+      test_combinations.combine(
+          mode=["graph", "eager"], dtype=_DTYPES_ALL))
+  def testBasic(self, dtype):
+    var0 = tf.Variable([1.0, 2.0], dtype=dtype, name="var0")
+    var1 = tf.Variable([3.0, 4.0], dtype=dtype, name="var1")
+    grads0, grads1 = _grad_constants(dtype)
+    # Numpy reference state, updated in lockstep with the optimizer.
+    var0_ref = np.array([1.0, 2.0])
+    var1_ref = np.array([3.0, 4.0])
+    accum0_ref = np.zeros(2)
+    accum1_ref = np.zeros(2)
+    grads0_ref = np.array([0.1, 0.1])
+    grads1_ref = np.array([0.01, 0.01])
+    mom_opt = self.mom_opt
+    # self.assertFalse(mom_opt._initial_decay)
+    grads_and_vars = [(grads0, var0), (grads1, var1)]
+    mom_update = mom_opt.apply_gradients(grads_and_vars)
+
+    # Check we have slots
+    slot0 = mom_opt.get_slot(var0, "momentum")
+    self.assertEqual(slot0.shape, var0.shape)
+    slot1 = mom_opt.get_slot(var1, "momentum")
+    self.assertEqual(slot1.shape, var1.shape)
+
+    # Step 1: the momentum accumulators where 0. So we should see a normal
+    # update: v -= grad * learning_rate
+    self.evaluate(tf.compat.v1.global_variables_initializer())
+    self.evaluate(mom_update)
+    var0_ref, accum0_ref = self._sgd_momentum_ref(var0_ref, accum0_ref,
+                                                  grads0_ref, 2.0, 0.9)
+    var1_ref, accum1_ref = self._sgd_momentum_ref(var1_ref, accum1_ref,
+                                                  grads1_ref, 2.0, 0.9)
+    # Fetch variables and slots in a single round-trip.
+    v0, v1, s0, s1 = self.evaluate([var0, var1, slot0, slot1])
+    # Check that the momentum accumulators have been updated.
+    self.assertAllCloseAccordingToType(accum0_ref, s0)
+    self.assertAllCloseAccordingToType(accum1_ref, s1)
+    # Check that the parameters have been updated.
+    self.assertAllCloseAccordingToType(var0_ref, v0)
+    self.assertAllCloseAccordingToType(var1_ref, v1)
+    # Step 2: the momentum accumulators contain the previous update.
+    self.evaluate(mom_update)
+    if tf.executing_eagerly():
+      mom_opt.apply_gradients(grads_and_vars)
+    var0_ref, accum0_ref = self._sgd_momentum_ref(var0_ref, accum0_ref,
+                                                  grads0_ref, 2.0, 0.9)
+    var1_ref, accum1_ref = self._sgd_momentum_ref(var1_ref, accum1_ref,
+                                                  grads1_ref, 2.0, 0.9)
+    v0, v1, s0, s1 = self.evaluate([var0, var1, slot0, slot1])
+    # Check that the momentum accumulators have been updated.
+    self.assertAllCloseAccordingToType(accum0_ref, s0)
+    self.assertAllCloseAccordingToType(accum1_ref, s1)
+    # Check that the parameters have been updated.
+    self.assertAllCloseAccordingToType(var0_ref, v0)
+    self.assertAllCloseAccordingToType(var1_ref, v1)
 
   def testNesterovMomentum(self):
     # TODO(tanzheny, omalleyt): Fix test in eager mode.
     with tf.Graph().as_default():
-      for dtype in [tf.float32, tf.float64]:
+      for dtype in _DTYPES_FAST:
         var0 = tf.Variable([1.0, 2.0], dtype=dtype, name="var0")
         var1 = tf.Variable([3.0, 4.0], dtype=dtype, name="var1")
         var0_np = np.array([1.0, 2.0], dtype=dtype.as_numpy_dtype)
@@ -382,54 +427,46 @@ class MomentumOptimizerTest(tf.test.TestCase, parameterized.TestCase):
           self.assertAllClose(var1_np, self.evaluate(var1))
 
   def testSparseNesterovMomentum(self):
-    # TODO(tanzheny, omalleyt): Fix test in eager mode.
-    for dtype in [tf.float32, tf.float64]:
-      with tf.Graph().as_default(), self.cached_session() as sess:
-        var0_np = np.array([1.0, 2.0], dtype=dtype.as_numpy_dtype)
-        var1_np = np.array([3.0, 4.0], dtype=dtype.as_numpy_dtype)
-        accum0_np = np.array([0.0, 0.0], dtype=dtype.as_numpy_dtype)
-        accum1_np = np.array([0.0, 0.0], dtype=dtype.as_numpy_dtype)
-        grads = []
-        for t in range(1, 5):
-          grads.append(var0_np * 10)
-          var0_np, accum0_np = self._update_nesterov_momentum_numpy(
-              var0_np, accum0_np, var0_np * 10, 2.0, 0.9)
-          var1_np, accum1_np = self._update_nesterov_momentum_numpy(
-              var1_np, accum1_np, 3, 2.0, 0.9)
-        var0_np = np.array([1.0, 2.0], dtype=dtype.as_numpy_dtype)
-        var1_np = np.array([3.0, 4.0], dtype=dtype.as_numpy_dtype)
-        accum0_np = np.array([0.0, 0.0], dtype=dtype.as_numpy_dtype)
-        accum1_np = np.array([0.0, 0.0], dtype=dtype.as_numpy_dtype)
-        var0 = tf.Variable(var0_np, dtype=dtype, name="var0")
-        var1 = tf.Variable(var1_np, dtype=dtype, name="var1")
-        mom_op = gradient_descent.SGD(
-            learning_rate=2.0, momentum=0.9, nesterov=True)
-        x_feed = tf.compat.v1.placeholder(dtype)
-        y_feed = tf.IndexedSlices(x_feed, tf.constant([0, 1]),
-                                   tf.constant([2]))
+    for dtype in _DTYPES_FAST:
+      var0_np = np.array([1.0, 2.0], dtype=dtype.as_numpy_dtype)
+      var1_np = np.array([3.0, 4.0], dtype=dtype.as_numpy_dtype)
+      accum0_np = np.array([0.0, 0.0], dtype=dtype.as_numpy_dtype)
+      accum1_np = np.array([0.0, 0.0], dtype=dtype.as_numpy_dtype)
+      var0 = tf.Variable(var0_np, dtype=dtype, name="var0")
+      var1 = tf.Variable(var1_np, dtype=dtype, name="var1")
+      mom_op = gradient_descent.SGD(
+          learning_rate=2.0, momentum=0.9, nesterov=True)
+
+      # The gradients are bound as an argument of a traced function rather
+      # than fed through a v1 placeholder; the concrete function is built once
+      # and reused for all four steps.
+      @tf.function(input_signature=[tf.TensorSpec([2], dtype)])
+      def step(grad_vals, mom_op=mom_op, var0=var0, var1=var1, dtype=dtype):
+        y_feed = tf.IndexedSlices(grad_vals, tf.constant([0, 1]),
+                                  tf.constant([2]))
         grads_and_vars = [(y_feed, var0),
                           (tf.constant([3.0, 3.0], dtype=dtype), var1)]
-        opt_update = mom_op.apply_gradients(grads_and_vars)
-        self.evaluate(tf.compat.v1.global_variables_initializer())
-        for t in range(1, 5):
-          sess.run(opt_update, feed_dict={x_feed: grads[t - 1]})
-          var0_np, accum0_np = self._update_nesterov_momentum_numpy(
-              var0_np, accum0_np, var0_np * 10, 2.0, 0.9)
-          var1_np, accum1_np = self._update_nesterov_momentum_numpy(
-              var1_np, accum1_np, 3, 2.0, 0.9)
-          self.assertAllClose(var0_np, self.evaluate(var0))
-          self.assertAllClose(var1_np, self.evaluate(var1))
+        mom_op.apply_gradients(grads_and_vars)
+
+      for _ in range(1, 5):
+        step(tf.constant(var0_np * 10, dtype=dtype))
+        var0_np, accum0_np = self._update_nesterov_momentum_numpy(
+            var0_np, accum0_np, var0_np * 10, 2.0, 0.9)
+        var1_np, accum1_np = self._update_nesterov_momentum_numpy(
+            var1_np, accum1_np, 3, 2.0, 0.9)
+        self.assertAllClose(var0_np, self.evaluate(var0))
+        self.assertAllClose(var1_np, self.evaluate(var1))
 
   def testMinimizeSparseResourceVariable(self):
     # TODO(tanzheny, omalleyt): Fix test in eager mode.
     with tf.Graph().as_default():
-      for dtype in [tf.half, tf.float32, tf.float64]:
+      for dtype in _DTYPES_FAST:
         var0 = tf.Variable([[1.0, 2.0]], dtype=dtype)
 
         # pylint: disable=cell-var-from-loop
         def loss():
           x = tf.constant([[4.0], [5.0]], dtype=dtype)
-          pred = tf.matmul(tf.compat.v1.nn.embedding_lookup([var0], [0]), x)
+          pred = tf.matmul(tf.gather(var0, [0]), x)
           return pred * pred
 
         # pylint: enable=cell-var-from-loop
@@ -459,16 +496,24 @@ class MomentumOptimizerTest(tf.test.TestCase, parameterized.TestCase):
   def testTensorLearningRateAndMomentum(self):
     # TODO(tanzheny, omalleyt): Fix test in eager mode.
     with tf.Graph().as_default():
-      for dtype in [tf.half, tf.float32, tf.float64]:
+      # One pair of constant nodes shared by all dtype iterations, rather
+      # than re-registering fresh constants in the graph per iteration.
+      lr_const = tf.constant(2.0)
+      momentum_const = tf.constant(0.9)
+      for dtype in _DTYPES_FAST:
         var0 = tf.Variable([1.0, 2.0], dtype=dtype)
         var1 = tf.Variable([3.0, 4.0], dtype=dtype)
-        grads0 = tf.constant([0.1, 0.1], dtype=dtype)
-        grads1 = tf.constant([0.01, 0.01], dtype=dtype)
+        grads0, grads1 = _grad_constants(dtype)
+        var0_ref = np.array([1.0, 2.0])
+        var1_ref = np.array([3.0, 4.0])
+        accum0_ref = np.zeros(2)
+        accum1_ref = np.zeros(2)
+        grads0_ref = np.array([0.1, 0.1])
+        grads1_ref = np.array([0.01, 0.01])
         mom_opt = gradient_descent.SGD(
-            learning_rate=tf.constant(2.0),
-            momentum=tf.constant(0.9))
-        mom_update = mom_opt.apply_gradients(
-            zip([grads0, grads1], [var0, var1]))
+            learning_rate=lr_const, momentum=momentum_const)
+        grads_and_vars = [(grads0, var0), (grads1, var1)]
+        mom_update = mom_opt.apply_gradients(grads_and_vars)
         self.evaluate(tf.compat.v1.global_variables_initializer())
         # Check we have slots
         slot0 = mom_opt.get_slot(var0, "momentum")
@@ -477,48 +522,41 @@ class MomentumOptimizerTest(tf.test.TestCase, parameterized.TestCase):
         self.assertEqual(slot1.shape, var1.shape)
 
         # Fetch params to validate initial values
-        self.assertAllClose([1.0, 2.0], self.evaluate(var0))
-        self.assertAllClose([3.0, 4.0], self.evaluate(var1))
+        v0, v1 = self.evaluate([var0, var1])
+        self.assertAllClose([1.0, 2.0], v0)
+        self.assertAllClose([3.0, 4.0], v1)
         # Step 1: the momentum accumulators where 0. So we should see a normal
         # update: v -= grad * learning_rate
         self.evaluate(mom_update)
+        var0_ref, accum0_ref = self._sgd_momentum_ref(var0_ref, accum0_ref,
+                                                      grads0_ref, 2.0, 0.9)
+        var1_ref, accum1_ref = self._sgd_momentum_ref(var1_ref, accum1_ref,
+                                                      grads1_ref, 2.0, 0.9)
+        v0, v1, s0, s1 = self.evaluate([var0, var1, slot0, slot1])
         # Check that the momentum accumulators have been updated.
-        self.assertAllCloseAccordingToType(
-            np.array([-0.2, -0.2]), self.evaluate(slot0))
-        self.assertAllCloseAccordingToType(
-            np.array([-0.02, -0.02]), self.evaluate(slot1))
+        self.assertAllCloseAccordingToType(accum0_ref, s0)
+        self.assertAllCloseAccordingToType(accum1_ref, s1)
         # Check that the parameters have been updated.
-        self.assertAllCloseAccordingToType(
-            np.array([1.0 - (0.1 * 2.0), 2.0 - (0.1 * 2.0)]),
-            self.evaluate(var0))
-        self.assertAllCloseAccordingToType(
-            np.array([3.0 - (0.01 * 2.0), 4.0 - (0.01 * 2.0)]),
-            self.evaluate(var1))
+        self.assertAllCloseAccordingToType(var0_ref, v0)
+        self.assertAllCloseAccordingToType(var1_ref, v1)
         # Step 2: the momentum accumulators contain the previous update.
         self.evaluate(mom_update)
+        var0_ref, accum0_ref = self._sgd_momentum_ref(var0_ref, accum0_ref,
+                                                      grads0_ref, 2.0, 0.9)
+        var1_ref, accum1_ref = self._sgd_momentum_ref(var1_ref, accum1_ref,
+                                                      grads1_ref, 2.0, 0.9)
+        v0, v1, s0, s1 = self.evaluate([var0, var1, slot0, slot1])
         # Check that the momentum accumulators have been updated.
-        self.assertAllCloseAccordingToType(
-            np.array([(0.9 * (-0.2) - 2.0 * 0.1), (0.9 * (-0.2) - 2.0 * 0.1)]),
-            self.evaluate(slot0))
-        self.assertAllCloseAccordingToType(
-            np.array([(0.9 * (-0.02) - 2.0 * 0.01),
-                      (0.9 * (-0.02) - 2.0 * 0.01)]), self.evaluate(slot1))
+        self.assertAllCloseAccordingToType(accum0_ref, s0)
+        self.assertAllCloseAccordingToType(accum1_ref, s1)
         # Check that the parameters have been updated.
-        self.assertAllCloseAccordingToType(
-            np.array([
-                1.0 - (0.1 * 2.0) - ((0.9 * 0.1 + 0.1) * 2.0),
-                2.0 - (0.1 * 2.0) - ((0.9 * 0.1 + 0.1) * 2.0)
-            ]), self.evaluate(var0))
-        self.assertAllCloseAccordingToType(
-            np.array([
-                2.98 - ((0.9 * 0.01 + 0.01) * 2.0),
-                3.98 - ((0.9 * 0.01 + 0.01) * 2.0)
-            ]), self.evaluate(var1))
+        self.assertAllCloseAccordingToType(var0_ref, v0)
+        self.assertAllCloseAccordingToType(var1_ref, v1)
 
   def testSparse(self):
     # TODO(tanzheny, omalleyt): Fix test in eager mode.
     with tf.Graph().as_default():
-      for dtype in [tf.half, tf.float32, tf.float64]:
+      for dtype in _DTYPES_FAST:
         var0 = tf.Variable(tf.zeros([4, 2], dtype=dtype))
         var1 = tf.Variable(tf.constant(1.0, dtype, [4, 2]))
         grads0 = tf.IndexedSlices(
@@ -527,9 +565,9 @@ class MomentumOptimizerTest(tf.test.TestCase, parameterized.TestCase):
         grads1 = tf.IndexedSlices(
             tf.constant([[.01, .01], [.01, .01]], dtype=dtype),
             tf.constant([2, 3]), tf.constant([4, 2]))
-        mom_opt = gradient_descent.SGD(learning_rate=2.0, momentum=0.9)
-        mom_update = mom_opt.apply_gradients(
-            zip([grads0, grads1], [var0, var1]))
+        mom_opt = self.mom_opt
+        grads_and_vars = [(grads0, var0), (grads1, var1)]
+        mom_update = mom_opt.apply_gradients(grads_and_vars)
         self.evaluate(tf.compat.v1.global_variables_initializer())
 
         # Check we have slots
@@ -538,73 +576,65 @@ class MomentumOptimizerTest(tf.test.TestCase, parameterized.TestCase):
         slot1 = mom_opt.get_slot(var1, "momentum")
         self.assertEqual(slot1.shape, var1.shape)
 
+        # Numpy reference state for the rows touched by the sparse updates;
+        # the remaining rows receive no gradient and must stay put.
+        var0_row1_ref = np.zeros(2)
+        accum0_row1_ref = np.zeros(2)
+        var1_row2_ref = np.ones(2)
+        accum1_row2_ref = np.zeros(2)
+        grads0_row1_ref = np.array([0.1, 0.1])
+        grads1_row2_ref = np.array([0.01, 0.01])
+
         # Fetch params to validate initial values
-        self.assertAllClose([0, 0], self.evaluate(var0)[0])
-        self.assertAllClose([0, 0], self.evaluate(var0)[1])
-        self.assertAllClose([1, 1], self.evaluate(var1)[2])
+        v0, v1 = self.evaluate([var0, var1])
+        self.assertAllClose([0, 0], v0[0])
+        self.assertAllClose([0, 0], v0[1])
+        self.assertAllClose([1, 1], v1[2])
 
         # Step 1: the momentum accumulators are 0. So we should see a normal
         # update: v -= grad * learning_rate
         self.evaluate(mom_update)
+        var0_row1_ref, accum0_row1_ref = self._sgd_momentum_ref(
+            var0_row1_ref, accum0_row1_ref, grads0_row1_ref, 2.0, 0.9)
+        var1_row2_ref, accum1_row2_ref = self._sgd_momentum_ref(
+            var1_row2_ref, accum1_row2_ref, grads1_row2_ref, 2.0, 0.9)
+        # Fetch variables and slots in a single round-trip.
+        v0, v1, s0, s1 = self.evaluate([var0, var1, slot0, slot1])
         # Check that the momentum accumulators have been updated.
-        self.assertAllCloseAccordingToType(
-            np.array([0, 0]),
-            self.evaluate(slot0)[0])
-        self.assertAllCloseAccordingToType(
-            np.array([-2.0 * .1, -2.0 * .1]),
-            self.evaluate(slot0)[1])
-        self.assertAllCloseAccordingToType(
-            np.array([-2.0 * .01, -2.0 * .01]),
-            self.evaluate(slot1)[2])
+        self.assertAllCloseAccordingToType(np.array([0, 0]), s0[0])
+        self.assertAllCloseAccordingToType(accum0_row1_ref, s0[1])
+        self.assertAllCloseAccordingToType(accum1_row2_ref, s1[2])
         # Check that the parameters have been updated.
-        self.assertAllCloseAccordingToType(
-            np.array([0, 0]),
-            self.evaluate(var0)[0])
-        self.assertAllCloseAccordingToType(
-            np.array([-(0.1 * 2.0), -(0.1 * 2.0)]),
-            self.evaluate(var0)[1])
-        self.assertAllCloseAccordingToType(
-            np.array([1.0 - (0.01 * 2.0), 1.0 - (0.01 * 2.0)]),
-            self.evaluate(var1)[2])
+        self.assertAllCloseAccordingToType(np.array([0, 0]), v0[0])
+        self.assertAllCloseAccordingToType(var0_row1_ref, v0[1])
+        self.assertAllCloseAccordingToType(var1_row2_ref, v1[2])
         # Step 2: the momentum accumulators contain the previous update.
         self.evaluate(mom_update)
+        var0_row1_ref, accum0_row1_ref = self._sgd_momentum_ref(
+            var0_row1_ref, accum0_row1_ref, grads0_row1_ref, 2.0, 0.9)
+        var1_row2_ref, accum1_row2_ref = self._sgd_momentum_ref(
+            var1_row2_ref, accum1_row2_ref, grads1_row2_ref, 2.0, 0.9)
+        v0, v1, s0, s1 = self.evaluate([var0, var1, slot0, slot1])
         # Check that the momentum accumulators have been updated.
-        self.assertAllClose(np.array([0, 0]), self.evaluate(slot0)[0])
-        self.assertAllCloseAccordingToType(
-            np.array([(0.9 * (-0.2) - 2.0 * 0.1), (0.9 * (-0.2) - 2.0 * 0.1)]),
-            self.evaluate(slot0)[1])
-        self.assertAllCloseAccordingToType(
-            np.array([(0.9 * (-0.02) - 2.0 * 0.01),
-                      (0.9 * (-0.02) - 2.0 * 0.01)]),
-            self.evaluate(slot1)[2])
+        self.assertAllClose(np.array([0, 0]), s0[0])
+        self.assertAllCloseAccordingToType(accum0_row1_ref, s0[1])
+        self.assertAllCloseAccordingToType(accum1_row2_ref, s1[2])
         # Check that the parameters have been updated.
-        self.assertAllClose(np.array([0, 0]), self.evaluate(var0)[0])
-        self.assertAllCloseAccordingToType(
-            np.array([
-                -(0.1 * 2.0) - ((0.9 * 0.1 + 0.1) * 2.0),
-                -(0.1 * 2.0) - ((0.9 * 0.1 + 0.1) * 2.0)
-            ]),
-            self.evaluate(var0)[1])
-        self.assertAllCloseAccordingToType(
-            np.array([
-                0.98 - ((0.9 * 0.01 + 0.01) * 2.0),
-                0.98 - ((0.9 * 0.01 + 0.01) * 2.0)
-            ]),
-            self.evaluate(var1)[2])
+        self.assertAllClose(np.array([0, 0]), v0[0])
+        self.assertAllCloseAccordingToType(var0_row1_ref, v0[1])
+        self.assertAllCloseAccordingToType(var1_row2_ref, v1[2])
 
   def testSharing(self):
     # TODO(tanzheny, omalleyt): Fix test in eager mode.
     with tf.Graph().as_default():
-      for dtype in [tf.half, tf.float32, tf.float64]:
+      for dtype in _DTYPES_FAST:
         var0 = tf.Variable([1.0, 2.0], dtype=dtype)
         var1 = tf.Variable([3.0, 4.0], dtype=dtype)
-        grads0 = tf.constant([0.1, 0.1], dtype=dtype)
-        grads1 = tf.constant([0.01, 0.01], dtype=dtype)
-        mom_opt = gradient_descent.SGD(learning_rate=2.0, momentum=0.9)
-        mom_update1 = mom_opt.apply_gradients(
-            zip([grads0, grads1], [var0, var1]))
-        mom_update2 = mom_opt.apply_gradients(
-            zip([grads0, grads1], [var0, var1]))
+        grads0, grads1 = _grad_constants(dtype)
+        mom_opt = self.mom_opt
+        grads_and_vars = [(grads0, var0), (grads1, var1)]
+        mom_update1 = mom_opt.apply_gradients(grads_and_vars)
+        mom_update2 = mom_opt.apply_gradients(grads_and_vars)
         self.evaluate(tf.compat.v1.global_variables_initializer())
 
         slot0 = mom_opt.get_slot(var0, "momentum")
@@ -612,44 +642,45 @@ class MomentumOptimizerTest(tf.test.TestCase, parameterized.TestCase):
         slot1 = mom_opt.get_slot(var1, "momentum")
         self.assertEqual(slot1.shape, var1.shape)
 
+        var0_ref = np.array([1.0, 2.0])
+        var1_ref = np.array([3.0, 4.0])
+        accum0_ref = np.zeros(2)
+        accum1_ref = np.zeros(2)
+        grads0_ref = np.array([0.1, 0.1])
+        grads1_ref = np.array([0.01, 0.01])
+
         # Fetch params to validate initial values
-        self.assertAllClose([1.0, 2.0], self.evaluate(var0))
-        self.assertAllClose([3.0, 4.0], self.evaluate(var1))
+        v0, v1 = self.evaluate([var0, var1])
+        self.assertAllClose([1.0, 2.0], v0)
+        self.assertAllClose([3.0, 4.0], v1)
         # Step 1: the momentum accumulators where 0. So we should see a normal
         # update: v -= grad * learning_rate
         self.evaluate(mom_update1)
+        var0_ref, accum0_ref = self._sgd_momentum_ref(var0_ref, accum0_ref,
+                                                      grads0_ref, 2.0, 0.9)
+        var1_ref, accum1_ref = self._sgd_momentum_ref(var1_ref, accum1_ref,
+                                                      grads1_ref, 2.0, 0.9)
+        # Fetch variables and slots in a single round-trip.
+        v0, v1, s0, s1 = self.evaluate([var0, var1, slot0, slot1])
         # Check that the momentum accumulators have been updated.
-        self.assertAllCloseAccordingToType(
-            np.array([-0.2, -0.2]), self.evaluate(slot0))
-        self.assertAllCloseAccordingToType(
-            np.array([-0.02, -0.02]), self.evaluate(slot1))
+        self.assertAllCloseAccordingToType(accum0_ref, s0)
+        self.assertAllCloseAccordingToType(accum1_ref, s1)
         # Check that the parameters have been updated.
-        self.assertAllCloseAccordingToType(
-            np.array([1.0 - (0.1 * 2.0), 2.0 - (0.1 * 2.0)]),
-            self.evaluate(var0))
-        self.assertAllCloseAccordingToType(
-            np.array([3.0 - (0.01 * 2.0), 4.0 - (0.01 * 2.0)]),
-            self.evaluate(var1))
+        self.assertAllCloseAccordingToType(var0_ref, v0)
+        self.assertAllCloseAccordingToType(var1_ref, v1)
         # Step 2: the second momentum accumulators contain the previous update.
         self.evaluate(mom_update2)
+        var0_ref, accum0_ref = self._sgd_momentum_ref(var0_ref, accum0_ref,
+                                                      grads0_ref, 2.0, 0.9)
+        var1_ref, accum1_ref = self._sgd_momentum_ref(var1_ref, accum1_ref,
+                                                      grads1_ref, 2.0, 0.9)
+        v0, v1, s0, s1 = self.evaluate([var0, var1, slot0, slot1])
         # Check that the momentum accumulators have been updated.
-        self.assertAllCloseAccordingToType(
-            np.array([(0.9 * (-0.2) - 2.0 * 0.1), (0.9 * (-0.2) - 2.0 * 0.1)]),
-            self.evaluate(slot0))
-        self.assertAllCloseAccordingToType(
-            np.array([(0.9 * (-0.02) - 2.0 * 0.01),
-                      (0.9 * (-0.02) - 2.0 * 0.01)]), self.evaluate(slot1))
+        self.assertAllCloseAccordingToType(accum0_ref, s0)
+        self.assertAllCloseAccordingToType(accum1_ref, s1)
         # Check that the parameters have been updated.
-        self.assertAllCloseAccordingToType(
-            np.array([
-                1.0 - (0.1 * 2.0) - ((0.9 * 0.1 + 0.1) * 2.0),
-                2.0 - (0.1 * 2.0) - ((0.9 * 0.1 + 0.1) * 2.0)
-            ]), self.evaluate(var0))
-        self.assertAllCloseAccordingToType(
-            np.array([
-                2.98 - ((0.9 * 0.01 + 0.01) * 2.0),
-                3.98 - ((0.9 * 0.01 + 0.01) * 2.0)
-            ]), self.evaluate(var1))
+        self.assertAllCloseAccordingToType(var0_ref, v0)
+        self.assertAllCloseAccordingToType(var1_ref, v1)
 
   @test_combinations.generate(
       test_combinations.combine(mode=["graph", "eager"]))
@@ -704,7 +735,7 @@ class MomentumOptimizerTest(tf.test.TestCase, parameterized.TestCase):
 
   @test_combinations.generate(test_combinations.combine(mode=["eager"]))
   def testMinimizeLossTensor(self):
-    for dtype in [tf.half, tf.float32, tf.float64]:
+    for dtype in _DTYPES_FAST:
       var0 = tf.Variable([[1.0, 2.0]], dtype=dtype)
       var1 = tf.Variable([3.0], dtype=dtype)
       x = tf.constant([[4.0], [5.0]], dtype=dtype)
@@ -253,5 +253,19 @@ class KerasOptimizersTest(test_combinations.TestCase):
     with self.assertRaisesRegex(ValueError, 'Could not interpret optimizer'):
       keras.optimizers.get(0)
 
+  def test_get_many(self):
+    sgd = keras.optimizers.gradient_descent_v2.SGD()
+    optimizers = keras.optimizers.get_many(
+        ['adam', 'SGD', {'class_name': 'RMSprop', 'config': {}}, sgd])
+    self.assertIsInstance(optimizers[0], keras.optimizers.adam_v2.Adam)
+    self.assertIsInstance(optimizers[1],
+                          keras.optimizers.gradient_descent_v2.SGD)
+    self.assertIsInstance(optimizers[2], keras.optimizers.rmsprop_v2.RMSprop)
+    self.assertIs(optimizers[3], sgd)
+
+  def test_get_many_error(self):
+    with self.assertRaisesRegex(ValueError, 'Could not interpret optimizer'):
+      keras.optimizers.get_many(['sgd', 0])
+
 if __name__ == '__main__':
   tf.test.main()
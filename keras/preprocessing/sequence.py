@@ -18,7 +18,6 @@
 # pylint: disable=g-direct-tensorflow-import
 
 import json
-import random
 
 from keras.utils import data_utils
 import numpy as np
@@ -37,11 +36,14 @@ def _remove_long_seq(maxlen, seq, label):
   Returns:
       new_seq, new_label: shortened lists for `seq` and `label`.
   """
-  new_seq, new_label = [], []
-  for x, y in zip(seq, label):
-    if len(x) < maxlen:
-      new_seq.append(x)
-      new_label.append(y)
+  lengths = np.fromiter(map(len, seq), dtype=np.int64, count=len(seq))
+  keep = lengths < maxlen
+  keep_indices = np.flatnonzero(keep)
+  new_seq = [seq[i] for i in keep_indices]
+  if isinstance(label, np.ndarray):
+    new_label = label[keep]
+  else:
+    new_label = [label[i] for i in keep_indices]
   return new_seq, new_label
 
 
@@ -81,6 +83,12 @@ class TimeseriesGenerator(data_utils.Sequence):
           in reverse chronological order.
       batch_size: Number of timeseries samples in each batch
           (except maybe the last one).
+      channels_first: Boolean: if `true`, `data` must be a 2D array of
+          shape `(timesteps, features)` and samples are emitted with shape
+          `(batch_size, features, length)` instead of
+          `(batch_size, length, features)`. The data is stored transposed,
+          so each feature's time window is contiguous in memory — useful
+          for consumers that process one feature series at a time.
 
   Returns:
       A [Sequence](
@@ -117,7 +125,8 @@ class TimeseriesGenerator(data_utils.Sequence):
                end_index=None,
                shuffle=False,
                reverse=False,
-               batch_size=128):
+               batch_size=128,
+               channels_first=False):
 
     if len(data) != len(targets):
       raise ValueError('Data and targets have to be' + ' of same length. '
@@ -126,6 +135,12 @@ class TimeseriesGenerator(data_utils.Sequence):
 
     self.data = data
     self.targets = targets
+    # Convert list-like inputs to arrays once, so that `__getitem__` does not
+    # redo the conversion on every batch. The originals are kept on
+    # `self.data`/`self.targets` for `get_config`. Inputs that do not convert
+    # cleanly (e.g. exotic indexables) fall back to per-row indexing.
+    self._data = self._as_indexable_array(data)
+    self._targets = self._as_indexable_array(targets)
     self.length = length
     self.sampling_rate = sampling_rate
     self.stride = stride
@@ -136,6 +151,33 @@ class TimeseriesGenerator(data_utils.Sequence):
     self.shuffle = shuffle
     self.reverse = reverse
     self.batch_size = batch_size
+    self.channels_first = channels_first
+    if channels_first:
+      if self._data is None or self._data.ndim != 2:
+        raise ValueError('`channels_first=True` requires `data` to be a '
+                         '2D array of shape `(timesteps, features)`.')
+      # With channels first, `_data` holds the transposed
+      # `(features, timesteps)` layout so each feature's window is one
+      # contiguous run of memory.
+      self._data = np.ascontiguousarray(self._data.T)
+    # Per-instance generator (PCG64) for shuffle mode: faster draws than the
+    # legacy global RandomState, and separate processes do not contend on
+    # global RNG state. The generator itself is not thread-safe, so threaded
+    # consumers must serialize their draws.
+    self._rng = np.random.default_rng()
+    # Cached JSON serialization of data/targets, filled on the first
+    # `get_config` call.
+    self._config_cache = None
+
+    # Offsets of the timesteps making up one sample, relative to its current
+    # step. Precomputing them lets `__getitem__` gather a whole batch with a
+    # single advanced-indexing operation instead of one Python-level slice
+    # per row. Reversal is folded into the offsets so no extra slicing is
+    # needed after the gather.
+    offsets = np.arange(-self.length, 0, self.sampling_rate)
+    if self.reverse:
+      offsets = offsets[::-1]
+    self._index_offsets = offsets
 
     if self.start_index > self.end_index:
       raise ValueError('`start_index+length=%i > end_index=%i` '
@@ -143,6 +185,25 @@ class TimeseriesGenerator(data_utils.Sequence):
                        'would be left to be used as current step.' %
                        (self.start_index, self.end_index))
 
+  @staticmethod
+  def _as_indexable_array(values):
+    """Returns `values` as an array suitable for row gathers, else `None`."""
+    if isinstance(values, np.ndarray):
+      return values
+    try:
+      array = np.asarray(values)
+    except (ValueError, TypeError):
+      return None
+    if array.ndim == 0 or len(array) != len(values):
+      return None
+    # Row gathers read whole timesteps at a time; a row-major layout keeps
+    # each timestep's features contiguous in memory. Fortran-ordered inputs
+    # (e.g. from some DataFrame conversions) are copied once here rather
+    # than strided over on every batch.
+    if not array.flags['C_CONTIGUOUS']:
+      array = np.ascontiguousarray(array)
+    return array
+
   def __len__(self):
     return (self.end_index - self.start_index +
             self.batch_size * self.stride) // (
@@ -150,7 +211,7 @@ class TimeseriesGenerator(data_utils.Sequence):
 
   def __getitem__(self, index):
     if self.shuffle:
-      rows = np.random.randint(
+      rows = self._rng.integers(
           self.start_index, self.end_index + 1, size=self.batch_size)
     else:
       i = self.start_index + self.batch_size * self.stride * index
@@ -158,36 +219,78 @@ class TimeseriesGenerator(data_utils.Sequence):
           i, min(i + self.batch_size * self.stride, self.end_index + 1),
           self.stride)
 
-    samples = np.array(
-        [self.data[row - self.length:row:self.sampling_rate] for row in rows])
-    targets = np.array([self.targets[row] for row in rows])
+    if self.channels_first:
+      samples = np.take(
+          self._data, rows[:, np.newaxis] + self._index_offsets,
+          axis=1).transpose(1, 0, 2)
+    elif self._data is not None:
+      samples = self._data[rows[:, np.newaxis] + self._index_offsets]
+    else:
+      samples = np.array(
+          [self.data[row - self.length:row:self.sampling_rate] for row in rows])
+      if self.reverse:
+        samples = samples[:, ::-1, ...]
+    if self._targets is not None:
+      targets = self._targets[rows]
+    else:
+      targets = np.array([self.targets[row] for row in rows])
 
-    if self.reverse:
-      return samples[:, ::-1, ...], targets
     return samples, targets
 
+  def as_dataset(self):
+    """Returns a `tf.data.Dataset` yielding this generator's batches.
+
+    The dataset assembles batches through parallel calls and prefetches
+    them, so batch construction overlaps with training instead of blocking
+    each step the way plain `Sequence` consumption does. In shuffle mode
+    `__getitem__` draws random rows from a generator that is not
+    thread-safe, so batches are assembled sequentially there (prefetching
+    still overlaps them with training).
+
+    Returns:
+        A `tf.data.Dataset` of `(samples, targets)` batches.
+    """
+    import tensorflow.compat.v2 as tf  # pylint: disable=g-import-not-at-top
+
+    samples, targets = self[0]
+    output_types = (tf.as_dtype(samples.dtype), tf.as_dtype(targets.dtype))
+
+    def fetch(index):
+      return self[index]
+
+    num_parallel_calls = None if self.shuffle else tf.data.AUTOTUNE
+    return tf.data.Dataset.range(len(self)).map(
+        lambda index: tf.numpy_function(fetch, [index], output_types),
+        num_parallel_calls=num_parallel_calls).prefetch(tf.data.AUTOTUNE)
+
   def get_config(self):
     """Returns the TimeseriesGenerator configuration as Python dictionary.
 
+    `data` and `targets` are treated as frozen after construction: their
+    JSON serialization is computed on the first call and reused afterwards.
+
     Returns:
         A Python dictionary with the TimeseriesGenerator configuration.
     """
-    data = self.data
-    if type(self.data).__module__ == np.__name__:
-      data = self.data.tolist()
-    try:
-      json_data = json.dumps(data)
-    except TypeError as e:
-      raise TypeError('Data not JSON Serializable:', data) from e
-
-    targets = self.targets
-    if type(self.targets).__module__ == np.__name__:
-      targets = self.targets.tolist()
-    try:
-      json_targets = json.dumps(targets)
-    except TypeError as e:
-      raise TypeError('Targets not JSON Serializable:', targets) from e
-
+    if self._config_cache is None:
+      data = self.data
+      if type(self.data).__module__ == np.__name__:
+        data = self.data.tolist()
+      try:
+        json_data = json.dumps(data)
+      except TypeError as e:
+        raise TypeError('Data not JSON Serializable:', data) from e
+
+      targets = self.targets
+      if type(self.targets).__module__ == np.__name__:
+        targets = self.targets.tolist()
+      try:
+        json_targets = json.dumps(targets)
+      except TypeError as e:
+        raise TypeError('Targets not JSON Serializable:', targets) from e
+      self._config_cache = (json_data, json_targets)
+
+    json_data, json_targets = self._config_cache
     return {
         'data': json_data,
         'targets': json_targets,
@@ -198,7 +301,8 @@ class TimeseriesGenerator(data_utils.Sequence):
         'end_index': self.end_index,
         'shuffle': self.shuffle,
         'reverse': self.reverse,
-        'batch_size': self.batch_size
+        'batch_size': self.batch_size,
+        'channels_first': self.channels_first
     }
 
   def to_json(self, **kwargs):
@@ -285,27 +389,37 @@ def pad_sequences(sequences, maxlen=None, dtype='int32',
   """
   if not hasattr(sequences, '__len__'):
     raise ValueError('`sequences` must be iterable.')
+  if truncating != 'pre' and truncating != 'post':
+    raise ValueError('Truncating type "%s" not understood' % truncating)
+  if padding != 'pre' and padding != 'post':
+    raise ValueError('Padding type "%s" not understood' % padding)
+  truncate_pre = truncating == 'pre'
+  pad_pre = padding == 'pre'
   num_samples = len(sequences)
 
-  lengths = []
-  sample_shape = ()
-  flag = True
+  try:
+    lengths = np.fromiter(
+        map(len, sequences), dtype=np.int64, count=num_samples)
+  except TypeError as e:
+    for x in sequences:
+      if not hasattr(x, '__len__'):
+        raise ValueError('`sequences` must be a list of iterables. '
+                         'Found non-iterable: ' + str(x)) from e
+    raise
 
   # take the sample shape from the first non empty sequence
   # checking for consistency in the main loop below.
-
-  for x in sequences:
-    try:
-      lengths.append(len(x))
-      if flag and len(x):
-        sample_shape = np.asarray(x).shape[1:]
-        flag = False
-    except TypeError as e:
-      raise ValueError('`sequences` must be a list of iterables. '
-                       'Found non-iterable: ' + str(x)) from e
-
+  first_non_empty = next((x for x in sequences if len(x)), None)
+  sample_shape = (
+      np.asarray(first_non_empty).shape[1:] if first_non_empty is not None
+      else ())
+
+  # `initial` participates in the reduction, so it is only a valid
+  # empty-input identity for the max.
+  length_min = lengths.min() if num_samples else 0
+  length_max = lengths.max(initial=0)
   if maxlen is None:
-    maxlen = np.max(lengths)
+    maxlen = length_max
 
   is_dtype_str = np.issubdtype(dtype, np.str_) or np.issubdtype(
       dtype, np.unicode_)
@@ -315,30 +429,47 @@ def pad_sequences(sequences, maxlen=None, dtype='int32',
         'You should set `dtype=object` for variable length strings.'.format(
             dtype, type(value)))
 
-  x = np.full((num_samples, maxlen) + sample_shape, value, dtype=dtype)
+  # Fast path: when every sample already has length `maxlen` there is
+  # nothing to pad or truncate, so the whole batch can be stacked at once.
+  if (num_samples and maxlen and
+      isinstance(sequences[0], (np.ndarray, list, tuple)) and
+      length_min == length_max == maxlen):
+    try:
+      # np.array rather than np.asarray: the result must be a fresh buffer
+      # even when `sequences` is already an ndarray of the target dtype.
+      return np.array(sequences, dtype=dtype)
+    except ValueError:
+      pass  # Inconsistent sample shapes; the loop below raises a clear error.
+
+  full_shape = (num_samples, maxlen) + sample_shape
+  if not is_dtype_str and value == 0:
+    # np.zeros gets zeroed pages straight from the allocator, whereas
+    # np.full writes every element even when the fill value is zero.
+    x = np.zeros(full_shape, dtype=dtype)
+  else:
+    x = np.full(full_shape, value, dtype=dtype)
   for idx, s in enumerate(sequences):
     if not len(s):  # pylint: disable=g-explicit-length-test
       continue  # empty list/array was found
-    if truncating == 'pre':
+    if truncate_pre:
       trunc = s[-maxlen:]  # pylint: disable=invalid-unary-operand-type
-    elif truncating == 'post':
-      trunc = s[:maxlen]
     else:
-      raise ValueError('Truncating type "%s" ' 'not understood' % truncating)
+      trunc = s[:maxlen]
 
-    # check `trunc` has expected shape
-    trunc = np.asarray(trunc, dtype=dtype)
+    # check `trunc` has expected shape. Arrays are written into `x` as-is
+    # below (the assignment casts in C), so only list-like samples pay the
+    # np.asarray conversion.
+    if not isinstance(trunc, np.ndarray):
+      trunc = np.asarray(trunc, dtype=dtype)
     if trunc.shape[1:] != sample_shape:
       raise ValueError('Shape of sample %s of sequence at position %s '
                        'is different from expected shape %s' %
                        (trunc.shape[1:], idx, sample_shape))
 
-    if padding == 'post':
-      x[idx, :len(trunc)] = trunc
-    elif padding == 'pre':
+    if pad_pre:
       x[idx, -len(trunc):] = trunc
     else:
-      raise ValueError('Padding type "%s" not understood' % padding)
+      x[idx, :len(trunc)] = trunc
   return x
 
 
@@ -374,12 +505,21 @@ def make_sampling_table(size, sampling_factor=1e-5):
       is the probability that a word of rank i should be sampled.
   """
   gamma = 0.577
-  rank = np.arange(size)
+  rank = np.arange(size, dtype=np.float64)
   rank[0] = 1
-  inv_fq = rank * (np.log(rank) + gamma) + 0.5 - 1. / (12. * rank)
-  f = sampling_factor * inv_fq
-
-  return np.minimum(1., f / np.sqrt(f))
+  # Evaluate the formula in place, reusing `rank` as scratch once its values
+  # are no longer needed, so the table is built with two buffers instead of
+  # one temporary per arithmetic op.
+  f = np.log(rank)
+  f += gamma
+  f *= rank
+  f += 0.5
+  np.divide(1. / 12., rank, out=rank)
+  f -= rank
+  f *= sampling_factor
+  np.sqrt(f, out=rank)
+  np.divide(f, rank, out=f)
+  return np.minimum(1., f, out=f)
 
 
 @keras_export('keras.preprocessing.sequence.skipgrams')
@@ -433,47 +573,51 @@ def skipgrams(sequence,
       By convention, index 0 in the vocabulary is
       a non-word and will be skipped.
   """
-  couples = []
-  labels = []
-  for i, wi in enumerate(sequence):
-    if not wi:
-      continue
-    if sampling_table is not None:
-      if sampling_table[wi] < random.random():
-        continue
-
-    window_start = max(0, i - window_size)
-    window_end = min(len(sequence), i + window_size + 1)
-    for j in range(window_start, window_end):
-      if j != i:
-        wj = sequence[j]
-        if not wj:
-          continue
-        couples.append([wi, wj])
-        if categorical:
-          labels.append([0, 1])
-        else:
-          labels.append(1)
+  # Build all positive pairs with array operations: each non-skipped center
+  # word is paired with every in-bounds, non-zero word in its window. The
+  # row-major flattening below preserves the (center, context) order of the
+  # original per-word loop.
+  seq_arr = np.asarray(sequence, dtype=np.int64)
+  num_words = len(seq_arr)
+  active = seq_arr != 0
+  if sampling_table is not None:
+    table_arr = np.asarray(sampling_table)
+    active &= table_arr[seq_arr] >= np.random.random(num_words)
+  centers = np.flatnonzero(active)
+  offsets = np.concatenate(
+      [np.arange(-window_size, 0),
+       np.arange(1, window_size + 1)])
+  contexts = centers[:, np.newaxis] + offsets
+  in_bounds = (contexts >= 0) & (contexts < num_words)
+  context_words = seq_arr[np.clip(contexts, 0, max(num_words - 1, 0))]
+  in_bounds &= context_words != 0
+  center_words = np.broadcast_to(seq_arr[centers][:, np.newaxis],
+                                 contexts.shape)
+  couples = np.stack([center_words[in_bounds], context_words[in_bounds]],
+                     axis=1).tolist()
+  if categorical:
+    labels = [[0, 1]] * len(couples)
+  else:
+    labels = [1] * len(couples)
 
   if negative_samples > 0:
     num_negative_samples = int(len(labels) * negative_samples)
-    words = [c[0] for c in couples]
-    random.shuffle(words)
-
-    couples += [[words[i % len(words)],
-                 random.randint(1, vocabulary_size - 1)]
-                for i in range(num_negative_samples)]
-    if categorical:
-      labels += [[1, 0]] * num_negative_samples
-    else:
-      labels += [0] * num_negative_samples
+    if num_negative_samples:
+      words = np.random.choice(
+          np.asarray(couples, dtype=np.int64)[:, 0], size=num_negative_samples)
+      noise = np.random.randint(
+          1, vocabulary_size, size=num_negative_samples, dtype=np.int64)
+      couples += np.stack([words, noise], axis=1).tolist()
+      if categorical:
+        labels += [[1, 0]] * num_negative_samples
+      else:
+        labels += [0] * num_negative_samples
 
   if shuffle:
-    if seed is None:
-      seed = random.randint(0, 10e6)
-    random.seed(seed)
-    random.shuffle(couples)
-    random.seed(seed)
-    random.shuffle(labels)
+    # One shared permutation keeps couples and labels aligned without
+    # reseeding and shuffling the two lists separately.
+    perm = np.random.default_rng(seed).permutation(len(couples))
+    couples = np.asarray(couples)[perm].tolist()
+    labels = np.asarray(labels)[perm].tolist()
 
   return couples, labels
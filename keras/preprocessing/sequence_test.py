@@ -201,6 +201,44 @@ class TestSequence(tf.test.TestCase):
         ValueError, r'`start_index\+length=50 > end_index=49` is disallowed'):
       sequence.TimeseriesGenerator(data, targets, length=50)
 
+  def test_TimeseriesGenerator_channels_first(self):
+    data = np.array([[i, -i] for i in range(50)])
+    targets = np.array([[i] for i in range(50)])
+
+    data_gen = sequence.TimeseriesGenerator(
+        data,
+        targets,
+        length=10,
+        sampling_rate=2,
+        batch_size=2,
+        channels_first=True)
+    x, y = data_gen[0]
+    self.assertAllClose(
+        x,
+        np.array([[[0, 2, 4, 6, 8], [0, -2, -4, -6, -8]],
+                  [[1, 3, 5, 7, 9], [-1, -3, -5, -7, -9]]]))
+    self.assertAllClose(y, np.array([[10], [11]]))
+
+    with self.assertRaisesRegex(ValueError, '`channels_first=True` requires'):
+      sequence.TimeseriesGenerator(
+          np.arange(50).reshape((50, 1, 1)),
+          targets,
+          length=10,
+          channels_first=True)
+
+  def test_TimeseriesGenerator_as_dataset(self):
+    data = np.array([[i] for i in range(50)])
+    targets = np.array([[i] for i in range(50)])
+
+    data_gen = sequence.TimeseriesGenerator(
+        data, targets, length=10, sampling_rate=2, batch_size=2)
+    dataset = data_gen.as_dataset()
+    x, y = next(iter(dataset))
+    self.assertAllClose(
+        x, np.array([[[0], [2], [4], [6], [8]], [[1], [3], [5], [7], [9]]]))
+    self.assertAllClose(y, np.array([[10], [11]]))
+    self.assertLen(list(dataset), len(data_gen))
+
   def test_TimeSeriesGenerator_doesnt_miss_any_sample(self):
     x = np.array([[i] for i in range(10)])
 